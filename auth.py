@@ -10,13 +10,19 @@ import os
 import logging
 from typing import Optional
 from google.cloud import secretmanager
+from functools import lru_cache
 import config
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
 def get_service_account_credentials():
     """
     Load service account credentials from file or Secret Manager
+    
+    Cached for the life of the process: Gmail, Sheets and the cold-start
+    auth check all need the same key, so it is fetched (and parsed) once.
+    A failed load raises and is not cached.
     """
     # Try to load from Secret Manager first (for production)
     if os.environ.get('USE_SECRET_MANAGER', 'false').lower() == 'true':
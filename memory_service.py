@@ -154,13 +154,15 @@ class ConversationMemory:
             
         try:
             doc_ref = self.client.collection(self.collection_name).document(thread_id)
+            # One timestamp for both fields, so they always agree
+            now = datetime.datetime.now()
             
             doc_ref.set({
                 "salutation_state": {
                     "first_salutation_used": True,
-                    "last_interaction_at": datetime.datetime.now()
+                    "last_interaction_at": now
                 },
-                "last_updated": datetime.datetime.now()
+                "last_updated": now
             }, merge=True)
             
             logger.info(f"🧠 Memory: Marked first salutation used for thread {thread_id}")
@@ -181,13 +183,15 @@ class ConversationMemory:
             
         try:
             doc_ref = self.client.collection(self.collection_name).document(thread_id)
+            # One timestamp for both fields, so they always agree
+            now = datetime.datetime.now()
             
             doc_ref.set({
                 "salutation_state": {
                     "special_greeting_used": True,
-                    "last_interaction_at": datetime.datetime.now()
+                    "last_interaction_at": now
                 },
-                "last_updated": datetime.datetime.now()
+                "last_updated": now
             }, merge=True)
             
             logger.info(f"🧠 Memory: Marked special greeting used for thread {thread_id}")
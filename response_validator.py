@@ -11,6 +11,8 @@ Version: 2.1 (Harmonized)
 
 import logging
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from collections import Counter
@@ -18,11 +20,116 @@ from collections import Counter
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# HALLUCINATION PATTERNS
+# ============================================================================
+
+# Not compiled with re.ASCII: \b must treat accented letters as word
+# characters ("6:11à" is not a time, "…aDè" does not end an address).
+_TIME_RE = re.compile(r'\b\d{1,2}[:.]\d{2}\b')
+# Applied to already-lowercased text (addresses are compared lowercased anyway),
+# so no re.IGNORECASE case folding in the inner loop
+_EMAIL_RE = re.compile(r'\b[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}\b')
+
+# Expanded pattern for Italian numbers (landline 0x, mobile 3x)
+# Matches: 06 12345678, 06-123..., 333 123...
+# Groups: prefix(0d|3dd), an optional separator, then digit groups of at least
+# 2 digits, each later group preceded by exactly one separator.
+# Not compiled with re.ASCII: numbers copied from documents/sheets may use
+# any Unicode space (NBSP, figure or thin space) as separator.
+# This matches the same spans as the old nested form
+# \d{2,8}(?:[-.\s]?\d{2,4})*, but a digit run can only be split at a
+# separator, so there is no exponential backtracking on long numeric strings.
+_PHONE_RE = re.compile(r'\b(?:0\d|3\d{2})[-.\s]?\d{2,}(?:[-.\s]\d{2,})*\b')
+
+# ✅ FIX #3: Phones need at least 8 digits (Italian phones have minimum 8 digits)
+# This prevents false positives like "ore 930" being flagged as hallucinated phone
+_MIN_PHONE_DIGITS = 8
+
+# Deletion table for phone normalization: a phone match only contains digits
+# and the [-.\s] separators (Unicode whitespace ends at U+3000)
+_PHONE_SEPARATORS = str.maketrans(
+    '', '', '-.' + ''.join(c for c in map(chr, range(0x3001)) if c.isspace())
+)
+
+
+def _normalize_time(t: str) -> str:
+    """Normalize time (9:30 -> 09:30, 9.30 -> 09:30)"""
+    t = t.replace('.', ':')
+    parts = t.split(':')
+    if len(parts) == 2:
+        try:
+            return f"{int(parts[0]):02d}:{int(parts[1]):02d}"
+        except ValueError:
+            return t
+    return t
+
+
+def _normalize_phone(p: str) -> str:
+    """Normalize phone (remove separators, keeping only digits)"""
+    return p.translate(_PHONE_SEPARATORS)
+
+
+# Shared result for texts without matches (no per-call set allocation)
+_NO_ENTITIES = frozenset()
+
+
+def _extract_times(text: str) -> frozenset:
+    """Extract normalized times from text"""
+    raw = _TIME_RE.findall(text)
+    if not raw:
+        return _NO_ENTITIES
+    return frozenset(_normalize_time(t) for t in raw)
+
+
+def _extract_emails(text_lower: str) -> frozenset:
+    """Extract email addresses from lowercased text"""
+    raw = _EMAIL_RE.findall(text_lower)
+    if not raw:
+        return _NO_ENTITIES
+    return frozenset(raw)
+
+
+def _extract_phones(text: str) -> frozenset:
+    """Extract normalized phone numbers, filtering short incidental matches"""
+    raw = _PHONE_RE.findall(text)
+    if not raw:
+        return _NO_ENTITIES
+    normalized = (_normalize_phone(p) for p in raw)
+    return frozenset(d for d in normalized if len(d) >= _MIN_PHONE_DIGITS)
+
+
+@lru_cache(maxsize=32)
+def _extract_kb_entities(knowledge_base: str) -> Dict[str, frozenset]:
+    """
+    Extract times, emails and phones from the knowledge base (memoized)
+    
+    The KB is identical across a batch of emails (or rebuilt with the same
+    content), so the regex scan over it is paid once per distinct KB.
+    """
+    return {
+        'times': _extract_times(knowledge_base),
+        'emails': _extract_emails(knowledge_base.lower()),
+        'phones': _extract_phones(knowledge_base),
+    }
+
+
+_NO_KB_ENTITIES = {'times': _NO_ENTITIES, 'emails': _NO_ENTITIES, 'phones': _NO_ENTITIES}
+
+
+# ============================================================================
+# CONTENT PATTERNS
+# ============================================================================
+
+# '...' used as a placeholder: "[...]" or a trailing ellipsis (not mid-text)
+_ELLIPSIS_PLACEHOLDER_RE = re.compile(r'\[\.\.\.\]|\.\.\.\s*$')
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of comprehensive response validation
@@ -111,53 +218,76 @@ class ResponseValidator:
     OPTIMAL_MIN_LENGTH = 100
     WARNING_MAX_LENGTH = 3000
     
-    def __init__(self, strict_mode: bool = False):
+    # Forbidden phrases (hallucination/uncertainty indicators)
+    FORBIDDEN_PHRASES = (
+        'non ho abbastanza informazioni',
+        'non posso rispondere',
+        'mi dispiace ma non',
+        'scusa ma non',
+        'purtroppo non posso',
+        'non sono sicuro',
+        'non sono sicura',
+        'potrebbe essere',
+        'probabilmente',
+        'forse',
+        'suppongo',
+        'immagino'
+    )
+    
+    # Language markers (for detection)
+    LANGUAGE_MARKERS = MappingProxyType({
+        'it': ('grazie', 'cordiali', 'saluti', 'gentile', 'parrocchia', 'messa', 'vorrei', 'quando'),
+        'en': ('thank', 'regards', 'dear', 'parish', 'mass', 'church', 'would', 'could'),
+        'es': ('gracias', 'saludos', 'estimado', 'parroquia', 'misa', 'iglesia', 'querría')
+    })
+    
+    # Placeholders
+    PLACEHOLDERS = (
+        'XXX', 'TODO', '<insert>', 'placeholder', 'tbd', 'TBD', '...'
+    )
+    # (placeholder, lowercased) pairs, so the checks don't lower() per call
+    _PLACEHOLDERS_LOWER = tuple((p, p.lower()) for p in PLACEHOLDERS)
+    
+    # Required signature pattern (case-insensitive)
+    SIGNATURE_PATTERN = re.compile(
+        r"segreteria\s+parrocchia\s+sant['\']?eugenio",
+        re.IGNORECASE
+    )
+    # Literal every signature match starts with: IGNORECASE keeps the regex
+    # engine from doing its own fast literal scan, so find it with str.find
+    SIGNATURE_PREFIX = 'segreteria'
+    
+    def __init__(self, strict_mode: bool = False, fail_fast: bool = True):
         """
         Initialize validator
         
         Args:
             strict_mode: If True, use higher validation threshold (0.8 vs 0.6)
+            fail_fast: If True, skip the remaining checks once the score drops
+                below the validity threshold (the response is already
+                rejected). Set to False to always get the full report of
+                errors and warnings.
         """
         logger.info("🔍 Initializing Harmonized ResponseValidator...")
         
         self.strict_mode = strict_mode
         self.min_valid_score = self.STRICT_MODE_SCORE if strict_mode else self.MIN_VALID_SCORE
+        self.fail_fast = fail_fast
         
-        # Forbidden phrases (hallucination/uncertainty indicators)
-        self.forbidden_phrases = [
-            'non ho abbastanza informazioni',
-            'non posso rispondere',
-            'mi dispiace ma non',
-            'scusa ma non',
-            'purtroppo non posso',
-            'non sono sicuro',
-            'non sono sicura',
-            'potrebbe essere',
-            'probabilmente',
-            'forse',
-            'suppongo',
-            'immagino'
-        ]
-        
-        # Language markers (for detection)
-        self.language_markers = {
-            'it': ['grazie', 'cordiali', 'saluti', 'gentile', 'parrocchia', 'messa', 'vorrei', 'quando'],
-            'en': ['thank', 'regards', 'dear', 'parish', 'mass', 'church', 'would', 'could'],
-            'es': ['gracias', 'saludos', 'estimado', 'parroquia', 'misa', 'iglesia', 'querría']
+        # Configuration is fixed after construction: build the stats once
+        self._validation_stats = {
+            'strict_mode': self.strict_mode,
+            'fail_fast': self.fail_fast,
+            'min_valid_score': self.min_valid_score,
+            'min_length': self.MIN_LENGTH_CHARS,
+            'max_length_warning': self.WARNING_MAX_LENGTH,
+            'forbidden_phrases_count': len(self.FORBIDDEN_PHRASES),
+            'supported_languages': tuple(self.LANGUAGE_MARKERS.keys()),
+            'placeholders_count': len(self.PLACEHOLDERS),
+            'version': '2.1 (Harmonized with plain URL format)'
         }
         
-        # Placeholders
-        self.placeholders = [
-            'XXX', 'TODO', '<insert>', 'placeholder', 'tbd', 'TBD', '...'
-        ]
-        
-        # Required signature pattern (case-insensitive)
-        self.signature_pattern = re.compile(
-            r"segreteria\s+parrocchia\s+sant['\']?eugenio",
-            re.IGNORECASE
-        )
-        
-        logger.info(f"✓ Harmonized ResponseValidator initialized (strict_mode={strict_mode})")
+        logger.info(f"✓ Harmonized ResponseValidator initialized (strict_mode={strict_mode}, fail_fast={fail_fast})")
         logger.info(f"   Min valid score: {self.min_valid_score}")
     
     def validate_response(
@@ -186,41 +316,44 @@ class ResponseValidator:
         details = {}
         score = 1.0
         
-        logger.info(f"🔍 Validating response ({len(response)} chars, lang={detected_language})...")
-        
-        # === CHECK 1: Length (CRITICAL for UX) ===
-        length_result = self._check_length(response)
-        errors.extend(length_result['errors'])
-        warnings.extend(length_result['warnings'])
-        details['length'] = length_result
-        score *= length_result['score']
-        
-        # === CHECK 2: Language Consistency (CRITICAL for multilingual) ===
-        lang_result = self._check_language(response, detected_language)
-        errors.extend(lang_result['errors'])
-        warnings.extend(lang_result['warnings'])
-        details['language'] = lang_result
-        score *= lang_result['score']
-        
-        # === CHECK 3: Signature (CRITICAL for brand identity) ===
-        sig_result = self._check_signature(response)
-        errors.extend(sig_result['errors'])
-        warnings.extend(sig_result['warnings'])
-        details['signature'] = sig_result
-        score *= sig_result['score']
-        
-        # === CHECK 4: Forbidden Content (CRITICAL) ===
-        content_result = self._check_forbidden_content(response)
-        errors.extend(content_result['errors'])
-        details['content'] = content_result
-        score *= content_result['score']
-        
-        # === CHECK 5: Hallucinations (CRITICAL) ===
-        halluc_result = self._check_hallucinations(response, knowledge_base)
-        errors.extend(halluc_result['errors'])
-        warnings.extend(halluc_result['warnings'])
-        details['hallucinations'] = halluc_result
-        score *= halluc_result['score']
+        # Measure once: the checks only need the (stripped) lengths
+        response_length = len(response)
+        stripped_length = len(response.strip())
+        
+        # Lowercase once and share the view across all checks
+        response_lower = response.lower()
+        
+        logger.info("🔍 Validating response (%d chars, lang=%s)...", response_length, detected_language)
+        
+        # Cheapest checks first, so that with fail_fast the rejecting ones
+        # (too short, placeholders, NO_REPLY, uncertainty phrases) skip the
+        # marker counting and the regex scans of the language and
+        # hallucination checks
+        checks = (
+            # === CHECK 1: Length (CRITICAL for UX) ===
+            ('length', lambda: self._check_length(stripped_length)),
+            # === CHECK 2: Signature (CRITICAL for brand identity) ===
+            ('signature', lambda: self._check_signature(response_lower)),
+            # === CHECK 3: Forbidden Content (CRITICAL) ===
+            ('content', lambda: self._check_forbidden_content(response, response_lower, stripped_length)),
+            # === CHECK 4: Language Consistency (CRITICAL for multilingual) ===
+            ('language', lambda: self._check_language(response_lower, detected_language)),
+            # === CHECK 5: Hallucinations (CRITICAL) ===
+            ('hallucinations', lambda: self._check_hallucinations(response, response_lower, knowledge_base)),
+        )
+        
+        for check_name, run_check in checks:
+            # Fail fast: check scores are <= 1.0, so once the product is below
+            # the threshold the response can never become valid again
+            if self.fail_fast and score < self.min_valid_score:
+                details[check_name] = self._skipped_check()
+                continue
+            
+            check_result = run_check()
+            errors.extend(check_result['errors'])
+            warnings.extend(check_result.get('warnings', []))
+            details[check_name] = check_result
+            score *= check_result['score']
         
         # === CHECK 6: Capital After Comma ===
         # REMOVED: Now handled by auto-correction in gemini_service.py
@@ -230,22 +363,24 @@ class ResponseValidator:
         is_valid = len(errors) == 0 and score >= self.min_valid_score
         
         # === LOG RESULTS ===
-        if errors:
-            logger.warning(f"❌ Validation FAILED: {len(errors)} error(s)")
+        # Runs once per email: use lazy %-formatting so nothing is formatted
+        # when the level is disabled
+        if errors and logger.isEnabledFor(logging.WARNING):
+            logger.warning("❌ Validation FAILED: %d error(s)", len(errors))
             for i, error in enumerate(errors, 1):
-                logger.warning(f"   {i}. {error}")
+                logger.warning("   %d. %s", i, error)
         
-        if warnings:
-            logger.info(f"⚠️  {len(warnings)} warning(s)")
+        if warnings and logger.isEnabledFor(logging.INFO):
+            logger.info("⚠️  %d warning(s)", len(warnings))
             for i, warning in enumerate(warnings[:3], 1):
-                logger.info(f"   {i}. {warning}")
+                logger.info("   %d. %s", i, warning)
             if len(warnings) > 3:
-                logger.info(f"   ... and {len(warnings) - 3} more")
+                logger.info("   ... and %d more", len(warnings) - 3)
         
         if is_valid:
-            logger.info(f"✓ Validation PASSED (score: {score:.2f})")
+            logger.info("✓ Validation PASSED (score: %.2f)", score)
         else:
-            logger.warning(f"✗ Validation FAILED (score: {score:.2f}, threshold: {self.min_valid_score})")
+            logger.warning("✗ Validation FAILED (score: %.2f, threshold: %s)", score, self.min_valid_score)
         
         return ValidationResult(
             is_valid=is_valid,
@@ -254,7 +389,7 @@ class ResponseValidator:
             warnings=warnings,
             details=details,
             metadata={
-                'response_length': len(response),
+                'response_length': response_length,
                 'expected_language': detected_language,
                 'strict_mode': self.strict_mode,
                 'threshold': self.min_valid_score
@@ -265,25 +400,31 @@ class ResponseValidator:
     # VALIDATION CHECKS (Private Methods)
     # ========================================================================
     
-    def _check_length(self, response: str) -> Dict:
+    def _check_length(self, length: int) -> Dict:
         """
         Check response length
         
         Critical UX issue: too short = unhelpful, too long = overwhelming
+        
+        Args:
+            length: Length of the stripped response (computed once by the caller)
         """
         errors = []
         warnings = []
         score = 1.0
         
-        length = len(response.strip())
+        # Bind thresholds once (each self.X is an instance + class dict lookup)
+        min_length = self.MIN_LENGTH_CHARS
+        optimal_min_length = self.OPTIMAL_MIN_LENGTH
+        warning_max_length = self.WARNING_MAX_LENGTH
         
-        if length < self.MIN_LENGTH_CHARS:
-            errors.append(f"Response too short ({length} chars, min {self.MIN_LENGTH_CHARS})")
+        if length < min_length:
+            errors.append(f"Response too short ({length} chars, min {min_length})")
             score = 0.0
-        elif length < self.OPTIMAL_MIN_LENGTH:
+        elif length < optimal_min_length:
             warnings.append(f"Response quite short ({length} chars)")
             score *= 0.85
-        elif length > self.WARNING_MAX_LENGTH:
+        elif length > warning_max_length:
             warnings.append(f"Response very long ({length} chars, may be verbose)")
             score *= 0.95
         
@@ -294,7 +435,7 @@ class ResponseValidator:
             'length': length
         }
     
-    def _check_language(self, response: str, expected_lang: str) -> Dict:
+    def _check_language(self, response_lower: str, expected_lang: str) -> Dict:
         """
         Check language consistency
         
@@ -304,14 +445,15 @@ class ResponseValidator:
         warnings = []
         score = 1.0
         
-        response_lower = response.lower()
-        
         # Detect actual language using markers
         marker_scores = {}
-        for lang, markers in self.language_markers.items():
+        for lang, markers in self.LANGUAGE_MARKERS.items():
             marker_scores[lang] = sum(1 for marker in markers if marker in response_lower)
         
-        detected_lang = max(marker_scores, key=marker_scores.get) if max(marker_scores.values()) > 0 else expected_lang
+        # Single pass argmax (ties resolve to the first language, as before)
+        detected_lang, best_count = max(marker_scores.items(), key=lambda item: item[1])
+        if best_count == 0:
+            detected_lang = expected_lang
         
         # Check match
         if detected_lang != expected_lang:
@@ -339,7 +481,7 @@ class ResponseValidator:
             'marker_scores': marker_scores
         }
     
-    def _check_signature(self, response: str) -> Dict:
+    def _check_signature(self, response_lower: str) -> Dict:
         """
         Check required signature
         
@@ -349,7 +491,9 @@ class ResponseValidator:
         warnings = []
         score = 1.0
         
-        if not self.signature_pattern.search(response.lower()):
+        # Only run the regex from the first possible match start
+        start = response_lower.find(self.SIGNATURE_PREFIX)
+        if start == -1 or not self.SIGNATURE_PATTERN.search(response_lower, start):
             warnings.append("Missing signature 'Segreteria Parrocchia Sant'Eugenio'")
             score = 0.95
         
@@ -359,7 +503,7 @@ class ResponseValidator:
             'warnings': warnings
         }
     
-    def _check_forbidden_content(self, response: str) -> Dict:
+    def _check_forbidden_content(self, response: str, response_lower: str, stripped_length: int) -> Dict:
         """
         Check for forbidden phrases and placeholders
         
@@ -368,11 +512,9 @@ class ResponseValidator:
         errors = []
         score = 1.0
         
-        response_lower = response.lower()
-        
         # Check forbidden phrases (uncertainty indicators)
         found_forbidden = [
-            phrase for phrase in self.forbidden_phrases if phrase in response_lower
+            phrase for phrase in self.FORBIDDEN_PHRASES if phrase in response_lower
         ]
         if found_forbidden:
             errors.append(f"Contains uncertainty phrases: {', '.join(found_forbidden[:2])}")
@@ -381,13 +523,13 @@ class ResponseValidator:
         # Check placeholders (incomplete response)
         # ✅ IMPROVED: Smarter placeholder detection
         found_placeholders = []
-        for p in self.placeholders:
+        for p, p_lower in self._PLACEHOLDERS_LOWER:
             # For '...', check if it's used as placeholder (not ellipsis in text)
             if p == '...':
                 # Look for patterns like [...] or "..." at end of sentences
-                if re.search(r'\[\.\.\.\]|\.\.\.\s*$', response):
+                if _ELLIPSIS_PLACEHOLDER_RE.search(response):
                     found_placeholders.append(p)
-            elif p.lower() in response_lower:
+            elif p_lower in response_lower:
                 found_placeholders.append(p)
         
         if found_placeholders:
@@ -395,7 +537,7 @@ class ResponseValidator:
             score = 0.0
         
         # Check NO_REPLY leakage
-        if 'NO_REPLY' in response and len(response.strip()) > 20:
+        if 'NO_REPLY' in response and stripped_length > 20:
             errors.append("Contains 'NO_REPLY' instruction (should have been filtered)")
             score = 0.0
         
@@ -406,7 +548,7 @@ class ResponseValidator:
             'found_placeholders': found_placeholders
         }
     
-    def _check_hallucinations(self, response: str, knowledge_base: str) -> Dict:
+    def _check_hallucinations(self, response: str, response_lower: str, knowledge_base: str) -> Dict:
         """
         Check for hallucinated data (invented information not in KB)
         
@@ -417,41 +559,28 @@ class ResponseValidator:
         score = 1.0
         hallucinations = {}
         
-        # Helper: Normalize time (9:30 -> 09:30, 9.30 -> 09:30)
-        def normalize_time(t):
-            t = t.replace('.', ':')
-            parts = t.split(':')
-            if len(parts) == 2:
-                try:
-                    return f"{int(parts[0]):02d}:{int(parts[1]):02d}"
-                except ValueError:
-                    return t
-            return t
-
-        # Helper: Normalize phone (remove non-digits)
-        def normalize_phone(p):
-            return re.sub(r'\D', '', p)
-        
-        # === Check 1: Times ===
-        time_pattern = r'\b\d{1,2}[:.]\d{2}\b'
-        response_times_raw = re.findall(time_pattern, response)
-        kb_times_raw = re.findall(time_pattern, knowledge_base)
+        response_times = _extract_times(response)
+        response_emails = _extract_emails(response_lower)
+        response_phones = _extract_phones(response)
         
-        response_times = set(normalize_time(t) for t in response_times_raw)
-        kb_times = set(normalize_time(t) for t in kb_times_raw)
+        # Nothing to verify: skip the KB lookup entirely
+        if response_times or response_emails or response_phones:
+            kb_entities = _extract_kb_entities(knowledge_base)
+        else:
+            kb_entities = _NO_KB_ENTITIES
         
-        invented_times = response_times - kb_times
+        # === Check 1: Times ===
+        invented_times = response_times - kb_entities['times']
         
         if invented_times:
-            warnings.append(f"Times not in KB: {', '.join(sorted(invented_times))}")
+            # One sorted list serves both the warning and the details
+            invented_times_list = sorted(invented_times)
+            warnings.append(f"Times not in KB: {', '.join(invented_times_list)}")
             score *= 0.85
-            hallucinations['times'] = list(invented_times)
+            hallucinations['times'] = invented_times_list
         
         # === Check 2: Email Addresses ===
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        response_emails = set(e.lower() for e in re.findall(email_pattern, response, re.IGNORECASE))
-        kb_emails = set(e.lower() for e in re.findall(email_pattern, knowledge_base, re.IGNORECASE))
-        invented_emails = response_emails - kb_emails
+        invented_emails = response_emails - kb_entities['emails']
         
         if invented_emails:
             errors.append(f"Email addresses not in KB: {', '.join(invented_emails)}")
@@ -459,21 +588,7 @@ class ResponseValidator:
             hallucinations['emails'] = list(invented_emails)
         
         # === Check 3: Phone Numbers ===
-        # Expanded pattern for Italian numbers (landline 0x, mobile 3x)
-        # Matches: 06 12345678, 06-123..., 333 123... 
-        # Groups: prefix(0d|3dd), separator?, digits...
-        phone_pattern = r'\b(?:0\d|3\d{2})[-.\s]?\d{2,8}(?:[-.\s]?\d{2,4})*\b'
-        
-        response_phones_raw = re.findall(phone_pattern, response)
-        kb_phones_raw = re.findall(phone_pattern, knowledge_base)
-        
-        # Normalize and filter short matches (avoiding incidental number matches)
-        # ✅ FIX #3: Increased from 6 to 8 digits (Italian phones have minimum 8 digits)
-        # This prevents false positives like "ore 930" being flagged as hallucinated phone
-        response_phones = set(normalize_phone(p) for p in response_phones_raw if len(normalize_phone(p)) >= 8)
-        kb_phones = set(normalize_phone(p) for p in kb_phones_raw if len(normalize_phone(p)) >= 8)
-        
-        invented_phones = response_phones - kb_phones
+        invented_phones = response_phones - kb_entities['phones']
         
         if invented_phones:
             errors.append(f"Phone numbers not in KB: {', '.join(invented_phones)}")
@@ -487,6 +602,16 @@ class ResponseValidator:
             'hallucinations': hallucinations
         }
     
+    @staticmethod
+    def _skipped_check() -> Dict:
+        """Neutral result for a check skipped by fail-fast"""
+        return {
+            'score': 1.0,
+            'errors': [],
+            'warnings': [],
+            'skipped': True
+        }
+    
     # _check_capital_after_comma REMOVED
     # Now handled by auto-correction in gemini_service.py (fix_capital_after_comma function)
     # This approach silently fixes the error rather than rejecting valid responses
@@ -496,14 +621,7 @@ class ResponseValidator:
     # ========================================================================
     
     def get_validation_stats(self) -> Dict[str, any]:
-        """Get validator configuration statistics"""
-        return {
-            'strict_mode': self.strict_mode,
-            'min_valid_score': self.min_valid_score,
-            'min_length': self.MIN_LENGTH_CHARS,
-            'max_length_warning': self.WARNING_MAX_LENGTH,
-            'forbidden_phrases_count': len(self.forbidden_phrases),
-            'supported_languages': list(self.language_markers.keys()),
-            'placeholders_count': len(self.placeholders),
-            'version': '2.1 (Harmonized with plain URL format)'
-        }
\ No newline at end of file
+        """Get validator configuration statistics (built once, returned as a copy)"""
+        stats = dict(self._validation_stats)
+        stats['supported_languages'] = list(stats['supported_languages'])
+        return stats
@@ -5,17 +5,31 @@ Handles loading data from Google Sheets with caching and error recovery
 ✅ FIXED: Single atomic check for cache operations
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timedelta
 import json
 from cachetools import TTLCache
-from threading import Lock
+from threading import Event, Lock
 from auth import get_sheets_service
 import config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cache lookup sentinel (cached values such as False or {} are legitimate)
+_MISSING = object()
+
+
+class _InflightLoad:
+    """Result slot shared by the threads waiting on one in-flight Sheets load"""
+    
+    __slots__ = ('done', 'result', 'error')
+    
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
 
 class SheetsManager:
     """
@@ -39,6 +53,9 @@ class SheetsManager:
         
         self._cache_lock = Lock()
         
+        # Loads currently running, by cache key (guarded by _cache_lock)
+        self._inflight: Dict[str, _InflightLoad] = {}
+        
         logger.info(f"✓ Sheets service initialized (KB TTL: {config.CACHE_DURATION_SECONDS}s, Status TTL: {config.SYSTEM_STATUS_CACHE_TTL}s)")
     
     # ========================================================================
@@ -80,10 +97,78 @@ class SheetsManager:
             if key in self.cache:
                 del self.cache[key]
     
+    def _load_or_wait(self, key: str, loader: Callable[[], Any], cache: Optional[TTLCache] = None) -> Any:
+        """
+        Run a cache-miss loader once per key, even under concurrent misses
+        
+        The first thread to miss runs the loader; threads missing the same key
+        meanwhile wait for it and share its result (or exception) instead of
+        issuing their own Sheets round-trip.
+        
+        Args:
+            key: Cache key being loaded
+            loader: Callable that fetches (and caches) the value
+            cache: Cache holding the key (defaults to the KB cache)
+            
+        Returns:
+            Value returned by the loader
+        """
+        if cache is None:
+            cache = self.cache
+        
+        with self._cache_lock:
+            # Another thread may have filled the cache since our miss
+            cached = cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+            
+            flight = self._inflight.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._inflight[key] = _InflightLoad()
+        
+        if not is_leader:
+            logger.info(f"⏳ Waiting for in-flight load of '{key}'")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        
+        try:
+            flight.result = loader()
+            return flight.result
+        except BaseException as e:
+            # Record any failure (even KeyboardInterrupt/SystemExit) so waiters
+            # re-raise it instead of returning the unset result as None
+            flight.error = e
+            raise
+        finally:
+            with self._cache_lock:
+                del self._inflight[key]
+            flight.done.set()
+    
     # ========================================================================
     # KNOWLEDGE BASE LOADING
     # ========================================================================
     
+    def _batch_get_values(self, ranges: List[str]) -> List[List[List]]:
+        """
+        Fetch several ranges in a single values.batchGet round-trip
+        
+        Args:
+            ranges: A1 ranges to fetch (e.g. 'Istruzioni!A:C')
+            
+        Returns:
+            Raw rows for each range, in the same order as requested
+        """
+        result = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=config.SPREADSHEET_ID,
+            ranges=ranges
+        ).execute()
+        
+        value_ranges = result.get('valueRanges', [])
+        return [value_range.get('values', []) for value_range in value_ranges]
+    
     def load_knowledge_base(self) -> Optional[Dict]:
         """
         ✅ FIXED: Load knowledge base WITHOUT race condition
@@ -102,6 +187,12 @@ class SheetsManager:
             logger.info("📦 Loading knowledge base from cache")
             return cached_data
         
+        return self._load_or_wait(cache_key, self._fetch_knowledge_base)
+    
+    def _fetch_knowledge_base(self) -> Optional[Dict]:
+        """Fetch the knowledge base from Sheets (cache miss path of load_knowledge_base)"""
+        cache_key = 'knowledge_base'
+        
         # Cache miss - load from Sheets
         logger.info(f"📊 Cache miss, loading from Google Sheets...")
         logger.info(f"   Spreadsheet: {config.SPREADSHEET_ID}")
@@ -137,83 +228,7 @@ class SheetsManager:
             
             logger.info(f"✓ Retrieved {len(values)} rows from sheet")
             
-            # Process rows
-            knowledge_base_entries = []
-            ignore_keywords = []
-            ignore_domains = []
-            
-            rows_processed = 0
-            rows_skipped = 0
-            
-            # Skip header row
-            for row in values[1:]:
-                if len(row) < 3:
-                    rows_skipped += 1
-                    continue
-                
-                category = row[0].strip() if row[0] else ''
-                question = row[1].strip() if len(row) > 1 and row[1] else ''
-                answer = row[2].strip() if len(row) > 2 and row[2] else ''
-                
-                if not category:
-                    rows_skipped += 1
-                    continue
-                
-                # Check for special ignore categories
-                category_lower = category.lower()
-                if 'da non processare' in category_lower or 'da ignorare' in category_lower:
-                    if answer:
-                        items = [item.strip() for item in answer.split(',')]
-                        for item in items:
-                            if '@' in item:
-                                ignore_domains.append(item)
-                            else:
-                                ignore_keywords.append(item)
-                        rows_processed += 1
-                else:
-                    # Add to knowledge base
-                    knowledge_base_entries.append({
-                        'category': category,
-                        'question': question,
-                        'answer': answer
-                    })
-                    rows_processed += 1
-            
-            logger.info(f"   Processed: {rows_processed} rows, Skipped: {rows_skipped} rows")
-            
-            # Build knowledge base string
-            knowledge_base_string = self._format_knowledge_base(knowledge_base_entries)
-            
-            # Merge with configured ignore lists
-            ignore_keywords.extend(config.IGNORE_KEYWORDS)
-            ignore_domains.extend(config.IGNORE_DOMAINS)
-            
-            # Remove duplicates
-            ignore_keywords = list(set(ignore_keywords))
-            ignore_domains = list(set(ignore_domains))
-            
-            # Validate result
-            if not knowledge_base_string or len(knowledge_base_string) < 100:
-                logger.warning(f"⚠️  Knowledge base seems too short ({len(knowledge_base_string)} chars)")
-            
-            result_data = {
-                'knowledge_base_string': knowledge_base_string,
-                'ignore_keywords': ignore_keywords,
-                'ignore_domains': ignore_domains,
-                'loaded_at': datetime.now().isoformat(),
-                'entry_count': len(knowledge_base_entries)
-            }
-            
-            # ✅ Store in cache (thread-safe)
-            self._set_in_cache(cache_key, result_data)
-            
-            logger.info(f"✓ Knowledge base loaded and cached")
-            logger.info(f"   KB entries: {len(knowledge_base_entries)}")
-            logger.info(f"   KB size: {len(knowledge_base_string)} chars")
-            logger.info(f"   Ignore keywords: {len(ignore_keywords)}")
-            logger.info(f"   Ignore domains: {len(ignore_domains)}")
-            
-            return result_data
+            return self._build_knowledge_base(values)
             
         except Exception as e:
             logger.error(f"❌ Error loading knowledge base: {e}")
@@ -230,6 +245,109 @@ class SheetsManager:
             # No cache available, re-raise error
             raise
     
+    def _build_knowledge_base(self, values: List[List]) -> Dict:
+        """
+        Parse the instructions sheet rows and cache the resulting KB data
+        
+        Args:
+            values: Raw rows from the instructions sheet (first row is header)
+            
+        Returns:
+            Dictionary containing KB data
+        """
+        cache_key = 'knowledge_base'
+        
+        # Process rows: KB entries are formatted as they are read
+        formatted_entries = []
+        entry_count = 0
+        ignore_keywords = []
+        ignore_domains = []
+        
+        rows_processed = 0
+        rows_skipped = 0
+        
+        # Skip header row
+        for row in values[1:]:
+            if len(row) < 3:
+                rows_skipped += 1
+                continue
+            
+            category = row[0].strip() if row[0] else ''
+            question = row[1].strip() if len(row) > 1 and row[1] else ''
+            answer = row[2].strip() if len(row) > 2 and row[2] else ''
+            
+            if not category:
+                rows_skipped += 1
+                continue
+            
+            # Check for special ignore categories
+            category_lower = category.lower()
+            if 'da non processare' in category_lower or 'da ignorare' in category_lower:
+                if answer:
+                    items = [item.strip() for item in answer.split(',')]
+                    for item in items:
+                        if '@' in item:
+                            ignore_domains.append(item)
+                        else:
+                            ignore_keywords.append(item)
+                    rows_processed += 1
+            else:
+                # Add to knowledge base
+                entry_count += 1
+                rows_processed += 1
+                
+                # Skip entries with missing data
+                if not answer:
+                    logger.debug(f"Skipping entry without answer: {category}")
+                    continue
+                
+                formatted_entries.append(f"""
+--- Informazione ---
+Categoria: {category}
+Argomento: {question}
+Dettagli: {answer}""")
+        
+        logger.info(f"   Processed: {rows_processed} rows, Skipped: {rows_skipped} rows")
+        
+        # Build knowledge base string
+        if not entry_count:
+            logger.warning("⚠️  No knowledge base entries to format")
+        
+        knowledge_base_string = '\n'.join(formatted_entries)
+        logger.debug(f"   Formatted {len(formatted_entries)} KB entries into {len(knowledge_base_string)} chars")
+        
+        # Merge with configured ignore lists
+        ignore_keywords.extend(config.IGNORE_KEYWORDS)
+        ignore_domains.extend(config.IGNORE_DOMAINS)
+        
+        # Lowercase once here (should_ignore_email matches case-insensitively)
+        # and remove duplicates, keeping sheet order then config order
+        ignore_keywords = list(dict.fromkeys(keyword.lower() for keyword in ignore_keywords))
+        ignore_domains = list(dict.fromkeys(domain.lower() for domain in ignore_domains))
+        
+        # Validate result
+        if not knowledge_base_string or len(knowledge_base_string) < 100:
+            logger.warning(f"⚠️  Knowledge base seems too short ({len(knowledge_base_string)} chars)")
+        
+        result_data = {
+            'knowledge_base_string': knowledge_base_string,
+            'ignore_keywords': ignore_keywords,
+            'ignore_domains': ignore_domains,
+            'loaded_at': datetime.now().isoformat(),
+            'entry_count': entry_count
+        }
+        
+        # ✅ Store in cache (thread-safe)
+        self._set_in_cache(cache_key, result_data)
+        
+        logger.info(f"✓ Knowledge base loaded and cached")
+        logger.info(f"   KB entries: {entry_count}")
+        logger.info(f"   KB size: {len(knowledge_base_string)} chars")
+        logger.info(f"   Ignore keywords: {len(ignore_keywords)}")
+        logger.info(f"   Ignore domains: {len(ignore_domains)}")
+        
+        return result_data
+    
     # ========================================================================
     # DOCTRINAL KNOWLEDGE BASE LOADING (THREE LAYERS)
     # ========================================================================
@@ -258,6 +376,12 @@ class SheetsManager:
             logger.info("📦 Loading doctrinal KB from cache")
             return cached_data
         
+        return self._load_or_wait(cache_key, self._fetch_doctrinal_kb)
+    
+    def _fetch_doctrinal_kb(self) -> Dict[str, str]:
+        """Fetch the three doctrinal layers from Sheets (cache miss path of load_doctrinal_kb)"""
+        cache_key = 'doctrinal_kb'
+        
         logger.info("📊 Loading doctrinal KB layers from Google Sheets...")
         
         result = {
@@ -273,14 +397,25 @@ class SheetsManager:
             ('Dottrina', 'dottrina', 'A:G'),
         ]
         
-        for sheet_name, key, columns in sheet_configs:
+        # Fetch all layers in one round-trip. A missing sheet fails the whole
+        # batch, so then fall back to one request per layer.
+        try:
+            batch_values = self._batch_get_values([
+                f'{sheet_name}!{columns}' for sheet_name, _, columns in sheet_configs
+            ])
+        except Exception as e:
+            logger.warning(f"⚠️  Batch load of doctrinal layers failed, loading them separately: {e}")
+            batch_values = [None] * len(sheet_configs)
+        
+        for (sheet_name, key, columns), values in zip(sheet_configs, batch_values):
             try:
-                data = self.service.spreadsheets().values().get(
-                    spreadsheetId=config.SPREADSHEET_ID,
-                    range=f'{sheet_name}!{columns}'
-                ).execute()
-                
-                values = data.get('values', [])
+                if values is None:
+                    data = self.service.spreadsheets().values().get(
+                        spreadsheetId=config.SPREADSHEET_ID,
+                        range=f'{sheet_name}!{columns}'
+                    ).execute()
+                    
+                    values = data.get('values', [])
                 
                 if not values or len(values) <= 1:
                     logger.warning(f"⚠️  Sheet {sheet_name} is empty or has only header")
@@ -363,6 +498,10 @@ class SheetsManager:
             logger.info("📦 Loading replacements from cache")
             return cached_data
         
+        return self._load_or_wait(cache_key, self._fetch_replacements)
+    
+    def _fetch_replacements(self) -> Dict[str, str]:
+        """Fetch the replacements from Sheets (cache miss path of load_replacements)"""
         try:
             logger.info(f"📊 Loading replacements from sheet: {config.REPLACEMENTS_SHEET}")
             
@@ -372,43 +511,7 @@ class SheetsManager:
             ).execute()
             
             values = result.get('values', [])
-            replacements = {}
-            
-            if not values:
-                logger.warning("⚠️  Replacements sheet is empty")
-                return {}
-            
-            # Skip header row
-            rows_loaded = 0
-            rows_skipped = 0
-            
-            for row in values[1:]:
-                if len(row) >= 2:
-                    bad_text = row[0].strip() if row[0] else ''
-                    good_text = row[1].strip() if row[1] else ''
-                    
-                    if bad_text and good_text:
-                        # Validate: warn if bad_text is same as good_text
-                        if bad_text == good_text:
-                            logger.warning(f"⚠️  Redundant replacement: '{bad_text}' -> '{good_text}'")
-                            rows_skipped += 1
-                            continue
-                        
-                        replacements[bad_text] = good_text
-                        rows_loaded += 1
-                    else:
-                        rows_skipped += 1
-                else:
-                    rows_skipped += 1
-            
-            # Store in cache (thread-safe)
-            self._set_in_cache(cache_key, replacements)
-            
-            logger.info(f"✓ Loaded {rows_loaded} replacement rules")
-            if rows_skipped > 0:
-                logger.info(f"   Skipped {rows_skipped} invalid/redundant rows")
-            
-            return replacements
+            return self._build_replacements(values)
             
         except Exception as e:
             logger.warning(f"⚠️  Could not load replacements sheet: {e}")
@@ -417,44 +520,55 @@ class SheetsManager:
             # Return empty dict instead of None
             return {}
     
-    # ========================================================================
-    # KNOWLEDGE BASE FORMATTING
-    # ========================================================================
-    
-    def _format_knowledge_base(self, entries: List[Dict]) -> str:
+    def _build_replacements(self, values: List[List]) -> Dict[str, str]:
         """
-        Format knowledge base entries into a structured string
+        Parse the Sostituzioni sheet rows and cache the resulting replacements
         
         Args:
-            entries: List of knowledge base entries with category, question, answer
+            values: Raw rows from the replacements sheet (first row is header)
             
         Returns:
-            Formatted knowledge base string
+            Dictionary of replacements (bad_text -> good_text)
         """
-        if not entries:
-            logger.warning("⚠️  No knowledge base entries to format")
-            return ""
+        cache_key = 'replacements'
         
-        formatted_entries = []
+        replacements = {}
         
-        for entry in entries:
-            # Skip entries with missing data
-            if not entry.get('answer'):
-                logger.debug(f"Skipping entry without answer: {entry.get('category', 'unknown')}")
-                continue
-            
-            formatted_entry = f"""
---- Informazione ---
-Categoria: {entry['category']}
-Argomento: {entry['question']}
-Dettagli: {entry['answer']}"""
-            formatted_entries.append(formatted_entry)
+        if not values:
+            logger.warning("⚠️  Replacements sheet is empty")
+            return {}
+        
+        # Skip header row
+        rows_loaded = 0
+        rows_skipped = 0
         
-        result = '\n'.join(formatted_entries)
+        for row in values[1:]:
+            if len(row) >= 2:
+                bad_text = row[0].strip() if row[0] else ''
+                good_text = row[1].strip() if row[1] else ''
+                
+                if bad_text and good_text:
+                    # Validate: warn if bad_text is same as good_text
+                    if bad_text == good_text:
+                        logger.warning(f"⚠️  Redundant replacement: '{bad_text}' -> '{good_text}'")
+                        rows_skipped += 1
+                        continue
+                    
+                    replacements[bad_text] = good_text
+                    rows_loaded += 1
+                else:
+                    rows_skipped += 1
+            else:
+                rows_skipped += 1
         
-        logger.debug(f"   Formatted {len(formatted_entries)} KB entries into {len(result)} chars")
+        # Store in cache (thread-safe)
+        self._set_in_cache(cache_key, replacements)
         
-        return result
+        logger.info(f"✓ Loaded {rows_loaded} replacement rules")
+        if rows_skipped > 0:
+            logger.info(f"   Skipped {rows_skipped} invalid/redundant rows")
+        
+        return replacements
     
     # ========================================================================
     # CACHE MANAGEMENT
@@ -497,9 +611,23 @@ Dettagli: {entry['answer']}"""
         # Clear cache
         self.clear_cache()
         
-        # Reload knowledge base
+        # Fetch KB and replacements in one round-trip. If the batch fails
+        # (e.g. the replacements sheet is missing), load them one by one.
         try:
-            kb_data = self.load_knowledge_base()
+            kb_values, replacement_values = self._batch_get_values([
+                f'{config.SHEET_NAME}!A:C',
+                f'{config.REPLACEMENTS_SHEET}!A:B'
+            ])
+        except Exception as e:
+            logger.warning(f"⚠️  Batch reload failed, loading sheets separately: {e}")
+            kb_values = replacement_values = None
+        
+        # Reload knowledge base (empty data goes through the loader's error handling)
+        try:
+            if kb_values:
+                kb_data = self._build_knowledge_base(kb_values)
+            else:
+                kb_data = self.load_knowledge_base()
             kb_success = kb_data is not None
         except Exception as e:
             logger.error(f"❌ Failed to reload knowledge base: {e}")
@@ -507,7 +635,10 @@ Dettagli: {entry['answer']}"""
         
         # Reload replacements (non-critical)
         try:
-            replacements = self.load_replacements()
+            if replacement_values is not None:
+                replacements = self._build_replacements(replacement_values)
+            else:
+                replacements = self.load_replacements()
             repl_success = True
         except Exception as e:
             logger.warning(f"⚠️  Failed to reload replacements: {e}")
@@ -572,6 +703,12 @@ Dettagli: {entry['answer']}"""
             if cached_status is not None:
                 return cached_status
         
+        return self._load_or_wait(cache_key, self._fetch_system_status, self.system_status_cache)
+    
+    def _fetch_system_status(self) -> bool:
+        """Read the kill-switch cell from Sheets (cache miss path of is_system_enabled)"""
+        cache_key = 'system_status'
+        
         # Cache miss - check sheet
         try:
             # Check Control!B2
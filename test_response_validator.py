@@ -0,0 +1,59 @@
+# test_response_validator.py - Regression tests for hallucination entity extraction
+"""
+Tests the ResponseValidator time/email/phone extraction against cases where
+optimized patterns diverged from the original behavior.
+"""
+
+import sys
+sys.path.insert(0, '.')
+
+from response_validator import ResponseValidator, _extract_phones
+
+
+def _hallucination_check(response, knowledge_base):
+    """Run only the hallucination check on a response"""
+    validator = ResponseValidator()
+    return validator._check_hallucinations(response, response.lower(), knowledge_base)
+
+
+def test_phone_groups_need_two_digits():
+    """A trailing single digit is not part of the number (as before the rewrite)"""
+    assert _extract_phones("335 12 34 567 8") == {'3351234567'}
+    assert _extract_phones("06 1 2 3 4 5 6 7") == set()
+
+
+def test_long_digit_runs_are_still_phones():
+    """Digit runs longer than 16 digits are still extracted"""
+    assert _extract_phones("06" + "1" * 20) == {"06" + "1" * 20}
+
+
+def test_phone_unicode_space_separators():
+    """KB numbers written with figure/thin spaces match replies using plain spaces"""
+    for space in ('\u00a0', '\u2007', '\u2009', '\u202f'):
+        kb = f"Segreteria: tel. 06{space}123{space}4567"
+        result = _hallucination_check("Può chiamarci allo 06 1234567.", kb)
+        assert result['score'] == 1.0, (repr(space), result['errors'])
+        assert not result['errors']
+
+
+def test_accented_letters_are_word_characters():
+    """An accented letter is a word character, not a boundary (no spurious time/email)"""
+    result = _hallucination_check("Ci vediamo alle 6:11à", "")
+    assert 'times' not in result['hallucinations']
+    
+    result = _hallucination_check("Scriva a info@esempio.itè per conferma", "")
+    assert 'emails' not in result['hallucinations']
+    assert result['score'] == 1.0
+
+
+if __name__ == "__main__":
+    tests = [obj for name, obj in list(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"Results: {len(tests) - failed}/{len(tests)} passed")
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import re
 import logging
 import locale
+from functools import lru_cache
 from typing import Optional, List, Dict, Tuple
 import config
 
@@ -806,6 +807,7 @@ def should_ignore_email(subject: str, content: str, sender_email: str,
         True if email should be ignored
     """
     text = (subject + ' ' + content).lower()
+    sender_lower = sender_email.lower()
     
     # Check keywords
     for keyword in ignore_keywords:
@@ -815,7 +817,7 @@ def should_ignore_email(subject: str, content: str, sender_email: str,
     
     # Check senders
     for sender in ignore_senders:
-        if sender.lower() in sender_email.lower():
+        if sender.lower() in sender_lower:
             logger.info(f"Email ignored due to sender: '{sender}'")
             return True
     
@@ -1009,6 +1011,12 @@ def is_broadcast_email(content: str, sender_email: str) -> bool:
     return indicators >= 2
 
 
+@lru_cache(maxsize=256)
+def _compile_replacement(bad_expr: str) -> re.Pattern:
+    """Compile (once) the case-insensitive literal pattern of a replacement rule"""
+    return re.compile(re.escape(bad_expr), re.IGNORECASE)
+
+
 def apply_replacements(text: str, replacements: Dict[str, str]) -> str:
     """
     Apply text replacements
@@ -1025,8 +1033,7 @@ def apply_replacements(text: str, replacements: Dict[str, str]) -> str:
     
     for bad_expr, good_expr in replacements.items():
         try:
-            escaped_bad = re.escape(bad_expr)
-            text = re.sub(escaped_bad, good_expr, text, flags=re.IGNORECASE)
+            text = _compile_replacement(bad_expr).sub(good_expr, text)
         except Exception as e:
             logger.warning(f"⚠️  Error applying replacement '{bad_expr}': {e}")
             continue